@@ -0,0 +1,52 @@
+# cython: language_level=3
+"""
+Conversion compilée (optionnelle) des nombres en lettres.
+
+Compilation sur place:
+    pip install cython
+    cythonize -i _convert.pyx
+
+cheque_printer.py utilise ce module s'il est compilé, sinon la version Python.
+La table des mots 0-999 est fournie par cheque_printer via init() : les règles
+d'accord (70-79, 80, 90-99, cents) restent écrites à un seul endroit.
+"""
+
+cdef tuple _mots = ()
+
+cdef long long[3] _DIVISEURS = [1000000000, 1000000, 1000]
+cdef tuple _SINGULIERS = ('un milliard', 'un million', 'mille')
+cdef tuple _PLURIELS = (' milliards', ' millions', ' mille')
+
+
+def init(tuple mots):
+    """Enregistre la table des 1000 premiers nombres en lettres (0-999)."""
+    global _mots
+    if len(mots) != 1000:
+        raise ValueError("La table doit contenir exactement 1000 entrées")
+    _mots = mots
+
+
+cpdef str convertir(object nombre):
+    """Convertit un nombre entier en lettres (mêmes résultats que _convertir_nombre)."""
+    if nombre >= 1000000000000:
+        return str(nombre)  # Fallback pour très grands nombres
+
+    cdef long long n = nombre
+    cdef long long q
+    cdef int k
+    cdef list parts
+
+    if n < 1000:
+        return _mots[n]
+
+    parts = []
+    for k in range(3):
+        q = n // _DIVISEURS[k]
+        n = n % _DIVISEURS[k]
+        if q == 1:
+            parts.append(_SINGULIERS[k])
+        elif q:
+            parts.append(_mots[q] + _PLURIELS[k])
+    if n:
+        parts.append(_mots[n])
+    return ' '.join(parts)
@@ -25,6 +25,187 @@ import sys
 import os
 import argparse
 import csv
+import functools
+import contextlib
+from concurrent.futures import ProcessPoolExecutor
+
+
+# Dictionnaire pour conversion des nombres en lettres
+UNITES = ['', 'un', 'deux', 'trois', 'quatre', 'cinq', 'six', 'sept', 'huit', 'neuf',
+          'dix', 'onze', 'douze', 'treize', 'quatorze', 'quinze', 'seize', 'dix-sept',
+          'dix-huit', 'dix-neuf']
+DIZAINES = ['', 'dix', 'vingt', 'trente', 'quarante', 'cinquante', 'soixante',
+            'soixante', 'quatre-vingt', 'quatre-vingt']
+
+
+# Mots d'échelle par rang de groupe de 3 chiffres : (forme pour 1, suffixe pluriel)
+# Le rang 0 (unités) n'a pas de mot d'échelle ; "mille" et non "un mille"
+_SCALES = (
+    None,
+    ('mille', ' mille'),
+    ('un million', ' millions'),
+    ('un milliard', ' milliards'),
+)
+
+
+def _build_table():
+    """
+    Construit une fois pour toutes les 1000 premiers nombres en lettres (0-999).
+    Les cas particuliers du français (70-79, 80, 90-99, cents) ne sont évalués qu'ici,
+    à l'import : à l'exécution, la conversion se réduit à des accès à _WORDS_0_999.
+    """
+    # 0-19
+    table = list(UNITES)
+
+    # 20-99
+    for dizaine in range(2, 10):
+        base = DIZAINES[dizaine]
+        for unite in range(10):
+            if dizaine == 7 or dizaine == 9:
+                # 70-79 et 90-99 : soixante-dix..., quatre-vingt-dix...
+                if dizaine == 7 and unite == 1:
+                    table.append(base + "-et-onze")
+                else:
+                    table.append(base + "-" + UNITES[10 + unite])
+            elif dizaine == 8:
+                table.append("quatre-vingts" if unite == 0 else base + "-" + UNITES[unite])
+            elif unite == 0:
+                table.append(base)
+            elif unite == 1:
+                table.append(base + "-et-un")
+            else:
+                table.append(base + "-" + UNITES[unite])
+
+    # 100-999
+    for n in range(100, 1000):
+        centaine = n // 100
+        reste = n % 100
+        if centaine == 1:
+            result = "cent"
+        else:
+            result = UNITES[centaine] + " cent"
+
+        if reste == 0 and centaine > 1:
+            result += "s"
+        elif reste > 0:
+            result += " " + table[reste]
+        table.append(result)
+
+    return tuple(table)
+
+
+_WORDS_0_999 = _build_table()
+
+
+@functools.lru_cache(maxsize=4096)
+def _convertir_nombre(n):
+    """
+    Convertit un nombre entier en lettres.
+    Mis en cache : les mêmes sous-nombres (0-999) reviennent sans cesse en mode CSV.
+    """
+    if n < 1000:
+        return _WORDS_0_999[n]
+    if n >= 10**12:
+        return str(n)  # Fallback pour très grands nombres
+
+    # Groupes de 3 chiffres, des unités vers les milliards
+    groups = []
+    while n:
+        n, r = divmod(n, 1000)
+        groups.append(r)
+
+    parts = []
+    for rang in range(len(groups) - 1, 0, -1):
+        r = groups[rang]
+        if r == 1:
+            parts.append(_SCALES[rang][0])
+        elif r:
+            parts.append(_WORDS_0_999[r] + _SCALES[rang][1])
+    if groups[0]:
+        parts.append(_WORDS_0_999[groups[0]])
+    return " ".join(parts)
+
+
+# Version Python pur, conservée même si la version compilée la remplace
+_convertir_nombre_py = _convertir_nombre
+
+# Version compilée (Cython) si le module _convert a été construit, sinon Python pur
+try:
+    import _convert
+except ImportError:
+    _convert = None
+else:
+    _convert.init(_WORDS_0_999)
+    _convertir_nombre = _convert.convertir
+
+
+def _spawn_wait(argv, capturer_stderr=False):
+    """
+    Lance une commande externe, attend sa fin et retourne (code de sortie, stderr).
+    Utilise posix_spawnp (pas de fork() du processus Python) quand il est disponible.
+    stderr vaut b"" sauf si capturer_stderr est vrai.
+    """
+    if not hasattr(os, 'posix_spawnp'):
+        cp = subprocess.run(argv, stderr=subprocess.PIPE if capturer_stderr else None)
+        return cp.returncode, cp.stderr or b""
+
+    erreur = b""
+    if capturer_stderr:
+        lecture, ecriture = os.pipe()
+        try:
+            pid = os.posix_spawnp(argv[0], argv, os.environ,
+                                  file_actions=[(os.POSIX_SPAWN_DUP2, ecriture, 2)])
+        except OSError:
+            os.close(lecture)
+            raise
+        finally:
+            os.close(ecriture)
+        with os.fdopen(lecture, 'rb') as f:
+            erreur = f.read()
+    else:
+        pid = os.posix_spawnp(argv[0], argv, os.environ)
+
+    _, status = os.waitpid(pid, 0)
+    if os.WIFEXITED(status):
+        return os.WEXITSTATUS(status), erreur
+    return -os.WTERMSIG(status), erreur
+
+
+# Champs dessinés par _draw : (position, argument), dans l'ordre de dessin
+_CHAMPS_DESSIN = (
+    ('montant_chiffres', 'montant_str'),
+    ('montant_lettres_ligne1', 'ligne1'),
+    ('montant_lettres_ligne2', 'ligne2'),
+    ('ordre', 'ordre'),
+    ('lieu', 'lieu'),
+    ('date', 'date'),
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _compiler_dessin(coordonnees):
+    """
+    Génère la fonction de dessin des champs avec les coordonnées en constantes.
+
+    Args:
+        coordonnees: Tuple des (x, y) en points, dans l'ordre de _CHAMPS_DESSIN
+
+    Le source n'est compilé (exec) qu'une fois par disposition : toutes les
+    instances de ChequePrinter partageant les mêmes positions réutilisent la fonction.
+    """
+    source = ["def _draw(c, montant_str, ligne1, ligne2, ordre, lieu, date):"]
+    for (nom, arg), (x, y) in zip(_CHAMPS_DESSIN, coordonnees):
+        appel = f"c.drawString({x!r}, {y!r}, {arg})"
+        if arg == 'ligne2':
+            # Deuxième ligne uniquement pour les montants longs
+            source.append("    if ligne2:")
+            source.append("        " + appel)
+        else:
+            source.append("    " + appel)
+
+    namespace = {}
+    exec("\n".join(source), namespace)
+    return namespace['_draw']
 
 
 class ChequePrinter:
@@ -45,114 +226,47 @@ class ChequePrinter:
     # Ajustez ces valeurs selon l'emplacement du chèque sur votre feuille
     CHEQUE_OFFSET = {'x': 10, 'y': 180}  # Position du coin bas-gauche du chèque
 
-    # Dictionnaire pour conversion des nombres en lettres
-    UNITES = ['', 'un', 'deux', 'trois', 'quatre', 'cinq', 'six', 'sept', 'huit', 'neuf',
-              'dix', 'onze', 'douze', 'treize', 'quatorze', 'quinze', 'seize', 'dix-sept',
-              'dix-huit', 'dix-neuf']
-    DIZAINES = ['', 'dix', 'vingt', 'trente', 'quarante', 'cinquante', 'soixante',
-                'soixante', 'quatre-vingt', 'quatre-vingt']
-
     def __init__(self, output_path="cheque.pdf"):
         self.output_path = output_path
         self.page_width, self.page_height = A4
 
-    def nombre_en_lettres(self, nombre):
-        """Convertit un nombre en lettres (format français pour chèques en dinars)."""
-        if nombre == 0:
-            return "zéro dinar"
-
-        # Séparer partie entière et centimes
-        dinars = int(nombre)
-        centimes = round((nombre - dinars) * 100)
+        # Positions converties une fois en points (offset du chèque inclus)
+        self._ox = self.CHEQUE_OFFSET['x'] * mm
+        self._oy = self.CHEQUE_OFFSET['y'] * mm
+        self._pos_pt = {nom: (self._ox + pos['x'] * mm, self._oy + pos['y'] * mm)
+                        for nom, pos in self.POSITIONS.items()}
+        # Fonction de dessin compilée une seule fois par disposition (cache du module)
+        self._draw = _compiler_dessin(tuple(self._pos_pt[nom] for nom, _ in _CHAMPS_DESSIN))
 
-        resultat = self._convertir_nombre(dinars)
-
-        if dinars == 1:
-            resultat += " dinar"
-        elif dinars > 1:
-            resultat += " dinars"
-
-        if centimes > 0:
-            resultat += " et " + self._convertir_nombre(centimes)
-            if centimes == 1:
-                resultat += " centime"
-            else:
-                resultat += " centimes"
-
-        return resultat.strip()
-
-    def _convertir_nombre(self, n):
-        """Convertit un nombre entier en lettres."""
-        if n == 0:
-            return ""
-        if n < 20:
-            return self.UNITES[n]
-        if n < 100:
-            dizaine = n // 10
-            unite = n % 10
-
-            if dizaine == 7 or dizaine == 9:
-                # 70-79 et 90-99
-                base = self.DIZAINES[dizaine]
-                if dizaine == 7:
-                    if unite == 1:
-                        return base + "-et-onze"
-                    else:
-                        return base + "-" + self.UNITES[10 + unite]
-                else:  # 90-99
-                    return base + "-" + self.UNITES[10 + unite]
-            elif dizaine == 8:
-                if unite == 0:
-                    return "quatre-vingts"
-                else:
-                    return "quatre-vingt-" + self.UNITES[unite]
-            else:
-                if unite == 0:
-                    return self.DIZAINES[dizaine]
-                elif unite == 1:
-                    return self.DIZAINES[dizaine] + "-et-un"
-                else:
-                    return self.DIZAINES[dizaine] + "-" + self.UNITES[unite]
+    def nombre_en_lettres(self, nombre, majuscule=False):
+        """
+        Convertit un nombre en lettres (format français pour chèques en dinars).
 
-        if n < 1000:
-            centaine = n // 100
-            reste = n % 100
-            if centaine == 1:
-                result = "cent"
-            else:
-                result = self.UNITES[centaine] + " cent"
-
-            if reste == 0 and centaine > 1:
-                result += "s"
-            elif reste > 0:
-                result += " " + self._convertir_nombre(reste)
-            return result
-
-        if n < 1000000:
-            millier = n // 1000
-            reste = n % 1000
-            if millier == 1:
-                result = "mille"
-            else:
-                result = self._convertir_nombre(millier) + " mille"
+        Args:
+            nombre: Montant à convertir
+            majuscule: Met une majuscule au premier mot (évite un .capitalize() sur tout le texte)
+        """
+        if nombre == 0:
+            parts = ["zéro", "dinar"]
+        else:
+            # Séparer partie entière et centimes
+            dinars = int(nombre)
+            centimes = round((nombre - dinars) * 100)
 
-            if reste > 0:
-                result += " " + self._convertir_nombre(reste)
-            return result
+            parts = []
+            if dinars == 1:
+                parts += [_convertir_nombre(dinars), "dinar"]
+            elif dinars > 1:
+                parts += [_convertir_nombre(dinars), "dinars"]
 
-        if n < 1000000000:
-            million = n // 1000000
-            reste = n % 1000000
-            if million == 1:
-                result = "un million"
-            else:
-                result = self._convertir_nombre(million) + " millions"
+            if centimes > 0:
+                parts += ["et", _convertir_nombre(centimes), "centime" if centimes == 1 else "centimes"]
 
-            if reste > 0:
-                result += " " + self._convertir_nombre(reste)
-            return result
+        if majuscule and parts:
+            premier = parts[0]
+            parts[0] = premier[:1].upper() + premier[1:]
 
-        return str(n)  # Fallback pour très grands nombres
+        return " ".join(parts)
 
     def _formater_montant(self, montant):
         """
@@ -170,7 +284,7 @@ class ChequePrinter:
 
         return montant_str
 
-    def generer_cheque(self, montant, ordre, lieu, date=None):
+    def generer_cheque(self, montant, ordre, lieu, date=None, afficher=True):
         """
         Génère un PDF avec les informations du chèque.
 
@@ -179,61 +293,71 @@ class ChequePrinter:
             ordre: Nom du bénéficiaire
             lieu: Lieu d'émission
             date: Date au format JJ/MM/AAAA (défaut: aujourd'hui)
+            afficher: Affiche le chemin du PDF généré (désactivé dans les processus de travail)
         """
         if date is None:
             date = datetime.now().strftime("%d/%m/%Y")
 
-        c = canvas.Canvas(self.output_path, pagesize=A4)
+        c = canvas.Canvas(self.output_path, pagesize=A4, pageCompression=1)
+        self._dessiner_cheque(c, montant, ordre, lieu, date)
 
-        # Police pour le chèque
-        c.setFont("Helvetica", 10)
+        c.save()
+        if afficher:
+            print(f"Chèque généré: {self.output_path}")
+        return self.output_path
+
+    def generer_batch(self, cheques, output_path=None):
+        """
+        Génère un seul PDF multi-pages, un chèque par page.
+        Le même Canvas est réutilisé : police et ressources ne sont écrites qu'une fois.
+
+        Args:
+            cheques: Liste de dicts avec les clés montant, ordre, lieu et date (optionnelle)
+            output_path: Fichier PDF de sortie (défaut: self.output_path)
+        """
+        if output_path is None:
+            output_path = self.output_path
+
+        aujourd_hui = datetime.now().strftime("%d/%m/%Y")
+
+        c = canvas.Canvas(output_path, pagesize=A4, pageCompression=1)
 
-        offset_x = self.CHEQUE_OFFSET['x'] * mm
-        offset_y = self.CHEQUE_OFFSET['y'] * mm
+        for cheque in cheques:
+            self._dessiner_cheque(c, cheque['montant'], cheque['ordre'], cheque['lieu'],
+                                  cheque.get('date') or aujourd_hui)
+            c.showPage()
+
+        c.save()
+        print(f"Chèques générés: {output_path}")
+        return output_path
+
+    def _dessiner_cheque(self, c, montant, ordre, lieu, date):
+        """Dessine les champs d'un chèque sur la page courante du canvas."""
+        # Police pour le chèque (showPage() réinitialise l'état graphique)
+        c.setFont("Helvetica", 10)
 
         # Montant en chiffres (formaté avec séparateurs de milliers)
         montant_str = self._formater_montant(montant)
-        pos = self.POSITIONS['montant_chiffres']
-        c.drawString(offset_x + pos['x'] * mm, offset_y + pos['y'] * mm, montant_str)
 
         # Montant en lettres (avec majuscule au début)
-        montant_lettres = self.nombre_en_lettres(montant).capitalize()
+        montant_lettres = self.nombre_en_lettres(montant, majuscule=True)
         # Découper si trop long (limite ~70 caractères par ligne)
         limite_ligne = 70
         if len(montant_lettres) > limite_ligne:
-            mots = montant_lettres.split()
-            ligne1 = ""
-            ligne2 = ""
-            sur_ligne2 = False
-            for mot in mots:
-                if not sur_ligne2 and len(ligne1) + len(mot) < limite_ligne:
-                    ligne1 += mot + " "
+            # Un seul passage : longueur cumulée de la ligne 1 (mots + espaces)
+            mots1, mots2, longueur1 = [], [], 0
+            for mot in montant_lettres.split():
+                # Le premier mot reste toujours sur la ligne 1, même s'il dépasse la limite
+                if not mots2 and (not mots1 or longueur1 + len(mot) < limite_ligne):
+                    mots1.append(mot)
+                    longueur1 += len(mot) + 1
                 else:
-                    sur_ligne2 = True
-                    ligne2 += mot + " "
-            pos1 = self.POSITIONS['montant_lettres_ligne1']
-            pos2 = self.POSITIONS['montant_lettres_ligne2']
-            c.drawString(offset_x + pos1['x'] * mm, offset_y + pos1['y'] * mm, ligne1.strip())
-            c.drawString(offset_x + pos2['x'] * mm, offset_y + pos2['y'] * mm, ligne2.strip())
+                    mots2.append(mot)
+            ligne1, ligne2 = " ".join(mots1), " ".join(mots2)
         else:
-            pos = self.POSITIONS['montant_lettres_ligne1']
-            c.drawString(offset_x + pos['x'] * mm, offset_y + pos['y'] * mm, montant_lettres)
-
-        # Ordre (bénéficiaire)
-        pos = self.POSITIONS['ordre']
-        c.drawString(offset_x + pos['x'] * mm, offset_y + pos['y'] * mm, ordre)
+            ligne1, ligne2 = montant_lettres, ""
 
-        # Lieu
-        pos = self.POSITIONS['lieu']
-        c.drawString(offset_x + pos['x'] * mm, offset_y + pos['y'] * mm, lieu)
-
-        # Date
-        pos = self.POSITIONS['date']
-        c.drawString(offset_x + pos['x'] * mm, offset_y + pos['y'] * mm, date)
-
-        c.save()
-        print(f"Chèque généré: {self.output_path}")
-        return self.output_path
+        self._draw(c, montant_str, ligne1, ligne2, ordre, lieu, date)
 
     def imprimer(self, imprimante=None):
         """
@@ -263,13 +387,14 @@ class ChequePrinter:
                 print(f"Plateforme non supportée: {sys.platform}")
                 return False
 
-            subprocess.run(cmd, check=True)
+            code, erreur = _spawn_wait(cmd, capturer_stderr=True)
+            if code != 0:
+                detail = erreur.decode(errors='replace').strip() or f"{' '.join(cmd)} a échoué (code {code})"
+                print(f"Erreur d'impression: {detail}")
+                return False
             print(f"Chèque envoyé à l'imprimante")
             return True
 
-        except subprocess.CalledProcessError as e:
-            print(f"Erreur d'impression: {e}")
-            return False
         except Exception as e:
             print(f"Erreur: {e}")
             return False
@@ -279,10 +404,10 @@ class ChequePrinter:
         Génère une page de calibration avec une grille pour ajuster les positions.
         Imprimez cette page et placez votre chèque dessus pour mesurer les positions.
         """
-        c = canvas.Canvas(output_path, pagesize=A4)
+        c = canvas.Canvas(output_path, pagesize=A4, pageCompression=1)
 
-        offset_x = self.CHEQUE_OFFSET['x'] * mm
-        offset_y = self.CHEQUE_OFFSET['y'] * mm
+        offset_x = self._ox
+        offset_y = self._oy
 
         # Dessiner le contour d'un chèque standard (175mm x 80mm)
         cheque_width = 175 * mm
@@ -341,22 +466,34 @@ class ChequePrinter:
         c.setStrokeColorRGB(0.7, 0.7, 0.7)
         c.setLineWidth(0.2)
 
-        for x in range(0, 176, 10):
-            c.line(offset_x + x * mm, offset_y, offset_x + x * mm, offset_y + cheque_height)
-            c.setFont("Helvetica", 6)
-            c.drawString(offset_x + x * mm, offset_y - 3 * mm, str(x))
+        # Coordonnées des lignes de la grille : (graduation, position en points)
+        grille_x = [(x, offset_x + x * mm) for x in range(0, 176, 10)]
+        grille_y = [(y, offset_y + y * mm) for y in range(0, 81, 10)]
 
-        for y in range(0, 81, 10):
-            c.line(offset_x, offset_y + y * mm, offset_x + cheque_width, offset_y + y * mm)
-            c.drawString(offset_x - 8 * mm, offset_y + y * mm, str(y))
+        # Toutes les lignes dans un seul chemin, tracé en une fois
+        grille = c.beginPath()
+        for _, gx in grille_x:
+            grille.moveTo(gx, offset_y)
+            grille.lineTo(gx, offset_y + cheque_height)
+        for _, gy in grille_y:
+            grille.moveTo(offset_x, gy)
+            grille.lineTo(offset_x + cheque_width, gy)
+        c.drawPath(grille, stroke=1, fill=0)
+
+        # Graduations, avec une seule sélection de police
+        c.setFont("Helvetica", 6)
+
+        for x, gx in grille_x:
+            c.drawString(gx, offset_y - 3 * mm, str(x))
+
+        for y, gy in grille_y:
+            c.drawString(offset_x - 8 * mm, gy, str(y))
 
         # Marquer les positions actuelles
         c.setFillColorRGB(1, 0, 0)
         c.setFont("Helvetica", 8)
 
-        for nom, pos in self.POSITIONS.items():
-            x = offset_x + pos['x'] * mm
-            y = offset_y + pos['y'] * mm
+        for nom, (x, y) in self._pos_pt.items():
             c.circle(x, y, 2, fill=1)
             c.drawString(x + 3, y + 3, nom)
 
@@ -412,16 +549,31 @@ def mode_interactif():
     ouvrir = input("Ouvrir le PDF ? (O/n) : ").strip().lower()
     if ouvrir != 'n':
         if sys.platform == "linux":
-            subprocess.run(["xdg-open", output])
+            _spawn_wait(["xdg-open", output])
         elif sys.platform == "darwin":
-            subprocess.run(["open", output])
+            _spawn_wait(["open", output])
         elif sys.platform == "win32":
             os.startfile(output)
 
     return printer
 
 
-def importer_csv(csv_path, output_dir="cheques_generes"):
+# Nombre de chèques à partir duquel importer_csv répartit le rendu sur plusieurs processus
+_SEUIL_PARALLELE = 16
+
+
+def _render_one(job):
+    """
+    Génère le PDF d'une ligne CSV (exécuté dans un processus de travail).
+    Fonction de module pour pouvoir être transmise à ProcessPoolExecutor.
+    Les messages sont affichés par le processus principal, dans l'ordre du CSV.
+    """
+    _, output_path, cheque = job
+    printer = ChequePrinter(output_path)
+    return printer.generer_cheque(**cheque, afficher=False)
+
+
+def importer_csv(csv_path, output_dir="cheques_generes", fusionner=False):
     """
     Importe plusieurs chèques depuis un fichier CSV.
 
@@ -431,39 +583,79 @@ def importer_csv(csv_path, output_dir="cheques_generes"):
         2345678,75;Marie Martin;Lyon;
 
     La colonne 'date' est optionnelle (utilise la date du jour si vide).
+    Avec fusionner=True, tous les chèques sont générés dans un seul PDF
+    (un chèque par page) au lieu d'un fichier par chèque.
     """
-    if not os.path.exists(csv_path):
+    # Ouverture directe plutôt qu'un os.path.exists() préalable
+    try:
+        f = open(csv_path, 'r', encoding='utf-8')
+    except FileNotFoundError:
         print(f"Erreur: Fichier '{csv_path}' introuvable")
         return []
 
-    # Créer le dossier de sortie
-    os.makedirs(output_dir, exist_ok=True)
+    # Lecture et validation dans le processus principal, génération en parallèle
+    jobs = []
 
-    cheques_generes = []
+    with f:
+        # Créer le dossier de sortie (dans le with : le CSV est fermé si cela échoue)
+        os.makedirs(output_dir, exist_ok=True)
+        # Préfixe calculé une fois : chemin de chaque chèque par simple concaténation
+        prefixe = os.path.join(output_dir, "")
 
-    with open(csv_path, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f, delimiter=';')
+        reader = csv.reader(f, delimiter=';')
 
-        for i, row in enumerate(reader, 1):
+        # En-tête lu une seule fois : les lignes sont ensuite lues par position
+        colonnes = {nom.strip(): idx for idx, nom in enumerate(next(reader, []))}
+        try:
+            i_montant, i_ordre, i_lieu = colonnes['montant'], colonnes['ordre'], colonnes['lieu']
+        except KeyError as e:
+            print(f"Erreur: Colonne {e} absente de l'en-tête de '{csv_path}'")
+            return []
+        i_date = colonnes.get('date', -1)
+        # Date par défaut calculée une seule fois pour tout le fichier
+        aujourd_hui = datetime.now().strftime("%d/%m/%Y")
+
+        # filter(None, ...) ignore les lignes vides, comme DictReader
+        for i, row in enumerate(filter(None, reader), 1):
             try:
-                montant = float(row['montant'].replace(',', '.').strip())
-                ordre = row['ordre'].strip()
-                lieu = row['lieu'].strip()
-                date = row.get('date', '').strip() or datetime.now().strftime("%d/%m/%Y")
+                montant = float(row[i_montant].replace(',', '.').strip())
+                ordre = row[i_ordre].strip()
+                lieu = row[i_lieu].strip()
+                date = (row[i_date].strip() if 0 <= i_date < len(row) else '') or aujourd_hui
 
                 # Nom de fichier sécurisé
                 nom_fichier = f"cheque_{i:03d}_{ordre[:20].replace(' ', '_')}.pdf"
-                output_path = os.path.join(output_dir, nom_fichier)
-
-                printer = ChequePrinter(output_path)
-                printer.generer_cheque(montant=montant, ordre=ordre, lieu=lieu, date=date)
-                cheques_generes.append(output_path)
+                output_path = prefixe + nom_fichier
 
-                print(f"  [{i}] {montant:.2f}€ -> {ordre}")
+                cheque = {'montant': montant, 'ordre': ordre, 'lieu': lieu, 'date': date}
+                jobs.append((i, output_path, cheque))
 
-            except (KeyError, ValueError) as e:
+            except (IndexError, ValueError) as e:
                 print(f"  [!] Ligne {i} ignorée: {e}")
 
+    if fusionner and jobs:
+        output_path = prefixe + "cheques.pdf"
+        ChequePrinter(output_path).generer_batch([cheque for _, _, cheque in jobs])
+        for i, _, cheque in jobs:
+            print(f"  [{i}] {cheque['montant']:.2f}€ -> {cheque['ordre']}")
+        print(f"\n{len(jobs)} chèque(s) généré(s) dans '{output_path}'")
+        return [output_path]
+
+    cheques_generes = []
+
+    # Petits lots : le démarrage du pool coûte plus que le rendu lui-même
+    parallele = len(jobs) >= _SEUIL_PARALLELE
+    pool = (ProcessPoolExecutor(max_workers=min(len(jobs), os.cpu_count() or 1))
+            if parallele else contextlib.nullcontext())
+
+    with pool as executor:
+        # map() conserve l'ordre du CSV pour les messages
+        chemins = executor.map(_render_one, jobs, chunksize=8) if parallele else map(_render_one, jobs)
+        for (i, _, cheque), output_path in zip(jobs, chemins):
+            cheques_generes.append(output_path)
+            print(f"Chèque généré: {output_path}")
+            print(f"  [{i}] {cheque['montant']:.2f}€ -> {cheque['ordre']}")
+
     print(f"\n{len(cheques_generes)} chèque(s) généré(s) dans '{output_dir}/'")
     return cheques_generes
 
@@ -508,6 +700,10 @@ Exemples:
     mode.add_argument('--exemple-csv', action='store_true',
                       help="Créer un fichier CSV d'exemple")
 
+    # Options du mode CSV
+    parser.add_argument('--fusionner', '--merge', action='store_true',
+                        help="Avec --csv : un seul PDF multi-pages au lieu d'un fichier par chèque")
+
     # Arguments pour un chèque unique
     parser.add_argument('-m', '--montant', type=float,
                         help="Montant en euros")
@@ -530,7 +726,7 @@ Exemples:
     if args.calibration:
         printer = ChequePrinter()
         printer.calibration_page()
-        subprocess.run(["xdg-open", "calibration.pdf"])
+        _spawn_wait(["xdg-open", "calibration.pdf"])
         return
 
     # Créer CSV exemple
@@ -546,7 +742,7 @@ Exemples:
     # Mode CSV
     if args.csv:
         print(f"\nImport depuis '{args.csv}':\n")
-        importer_csv(args.csv)
+        importer_csv(args.csv, fusionner=args.fusionner)
         return
 
     # Mode ligne de commande (chèque unique)
@@ -566,9 +762,9 @@ Exemples:
 
         if args.ouvrir:
             if sys.platform == "linux":
-                subprocess.run(["xdg-open", args.output])
+                _spawn_wait(["xdg-open", args.output])
             elif sys.platform == "darwin":
-                subprocess.run(["open", args.output])
+                _spawn_wait(["open", args.output])
             elif sys.platform == "win32":
                 os.startfile(args.output)
         return
@@ -0,0 +1,140 @@
+"""
+Tests de la conversion des nombres en lettres.
+
+Lancer avec: python -m unittest test_cheque_printer  (ou: python -m pytest)
+"""
+
+import random
+import unittest
+
+import cheque_printer
+
+
+UNITES = ['', 'un', 'deux', 'trois', 'quatre', 'cinq', 'six', 'sept', 'huit', 'neuf',
+          'dix', 'onze', 'douze', 'treize', 'quatorze', 'quinze', 'seize', 'dix-sept',
+          'dix-huit', 'dix-neuf']
+DIZAINES = ['', 'dix', 'vingt', 'trente', 'quarante', 'cinquante', 'soixante',
+            'soixante', 'quatre-vingt', 'quatre-vingt']
+
+
+def convertir_reference(n):
+    """Algorithme récursif d'origine (avant les tables précalculées), valable jusqu'à 10**9."""
+    if n == 0:
+        return ""
+    if n < 20:
+        return UNITES[n]
+    if n < 100:
+        dizaine = n // 10
+        unite = n % 10
+
+        if dizaine == 7 or dizaine == 9:
+            base = DIZAINES[dizaine]
+            if dizaine == 7:
+                if unite == 1:
+                    return base + "-et-onze"
+                else:
+                    return base + "-" + UNITES[10 + unite]
+            else:
+                return base + "-" + UNITES[10 + unite]
+        elif dizaine == 8:
+            if unite == 0:
+                return "quatre-vingts"
+            else:
+                return "quatre-vingt-" + UNITES[unite]
+        else:
+            if unite == 0:
+                return DIZAINES[dizaine]
+            elif unite == 1:
+                return DIZAINES[dizaine] + "-et-un"
+            else:
+                return DIZAINES[dizaine] + "-" + UNITES[unite]
+
+    if n < 1000:
+        centaine = n // 100
+        reste = n % 100
+        if centaine == 1:
+            result = "cent"
+        else:
+            result = UNITES[centaine] + " cent"
+
+        if reste == 0 and centaine > 1:
+            result += "s"
+        elif reste > 0:
+            result += " " + convertir_reference(reste)
+        return result
+
+    if n < 1000000:
+        millier = n // 1000
+        reste = n % 1000
+        if millier == 1:
+            result = "mille"
+        else:
+            result = convertir_reference(millier) + " mille"
+
+        if reste > 0:
+            result += " " + convertir_reference(reste)
+        return result
+
+    million = n // 1000000
+    reste = n % 1000000
+    if million == 1:
+        result = "un million"
+    else:
+        result = convertir_reference(million) + " millions"
+
+    if reste > 0:
+        result += " " + convertir_reference(reste)
+    return result
+
+
+def _echantillon():
+    """Valeurs de 0 à 10**9 : toutes jusqu'à 20 000, puis un tirage fixe."""
+    rng = random.Random(0)
+    return list(range(20000)) + [rng.randrange(10**9) for _ in range(20000)]
+
+
+class TestTable(unittest.TestCase):
+
+    def test_table_0_999(self):
+        self.assertEqual(len(cheque_printer._WORDS_0_999), 1000)
+        for n in range(1000):
+            self.assertEqual(cheque_printer._WORDS_0_999[n], convertir_reference(n), n)
+
+
+class TestConversion(unittest.TestCase):
+
+    SPOT = {
+        80: "quatre-vingts",
+        200: "deux cents",
+        1000: "mille",
+        80000: "quatre-vingts mille",
+        1000000: "un million",
+        2000000001: "deux milliards un",
+    }
+
+    def verifier(self, convertir):
+        for n, attendu in self.SPOT.items():
+            self.assertEqual(convertir(n), attendu, n)
+        for n in _echantillon():
+            self.assertEqual(convertir(n), convertir_reference(n), n)
+
+    def test_python(self):
+        self.verifier(cheque_printer._convertir_nombre_py)
+
+    @unittest.skipIf(cheque_printer._convert is None, "module _convert non compilé")
+    def test_cython(self):
+        self.verifier(cheque_printer._convert.convertir)
+
+    def test_nombre_en_lettres(self):
+        printer = cheque_printer.ChequePrinter()
+        self.assertEqual(printer.nombre_en_lettres(0), "zéro dinar")
+        self.assertEqual(printer.nombre_en_lettres(1.01, majuscule=True), "Un dinar et un centime")
+        self.assertEqual(
+            printer.nombre_en_lettres(1234567.89),
+            "un million deux cent trente-quatre mille cinq cent soixante-sept dinars "
+            "et quatre-vingt-neuf centimes",
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()